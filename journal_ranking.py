@@ -1,8 +1,194 @@
 import argparse
-import requests
-from bs4 import BeautifulSoup
+import pandas as pd
+import requests_cache
+from requests.adapters import HTTPAdapter
+from lxml import etree, html
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
 import time
+import warnings
 import re
+import math
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+BASE_URL = "https://www.scimagojr.com/journalrank.php"
+PAGE_SIZE = 50        # Journals listed per ranking page
+MAX_PAGES = 100       # Page bound used when the category size is unknown
+MAX_WORKERS = 4       # Concurrent page downloads, kept low to be polite
+CATEGORY_WORKERS = 3  # Categories scraped at once by get_all_rankings
+MAX_RETRIES = 3       # Attempts per request when SCImago answers 429
+MISSING_TTL = 900     # Seconds a failed journal search is remembered
+MAX_CACHED_CATEGORIES = 64  # Category rankings kept parsed in memory
+
+# Lifetime of cached SCImago pages, both on disk and in memory
+CACHE_EXPIRY = timedelta(hours=12)
+
+# On-disk caches live in one fixed place, whatever the working directory
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "scimago")
+# Journal categories found by previous runs (see load_journal_categories)
+CATEGORY_CACHE = os.path.join(CACHE_DIR, "categories.json")
+CATEGORY_CACHE_TTL = 86400  # Seconds, same as the app's category cache
+
+# Politeness settings, overridable from the environment
+RATE_LIMIT_DELAY = float(os.environ.get("SCRAPER_RATE_LIMIT_DELAY", "0.3"))
+RATE_LIMIT_RPM = int(os.environ.get("SCRAPER_RATE_LIMIT_RPM", "60"))
+
+_TOTAL_SIZE_RE = re.compile(r"total_size=(\d+)")
+_PAGE_RE = re.compile(r"page=(\d+)")
+_CAT_RE = re.compile(r"category=(\d+)")
+
+# SCImago always serves UTF-8, so skip per-page charset detection and
+# reuse a single parser for every page
+_HTML_PARSER = html.HTMLParser(encoding="utf-8")
+
+# Journal and category links on search results and profile pages
+_JOURNAL_LINKS_XPATH = etree.XPath('.//a[.//*[contains(@class, "jrnlname")]]')
+_CAT_LINKS_XPATH = etree.XPath('.//a[contains(@href, "journalrank.php?category=")]')
+
+# Lookups for ranking tables, compiled once and reused for every page
+_TOTAL_SIZE_HREFS_XPATH = etree.XPath('//a[contains(@href, "total_size=")]/@href')
+_PAGE_HREFS_XPATH = etree.XPath('//a[contains(@href, "page=")]/@href')
+_JOURNAL_ROWS_XPATH = etree.XPath('//tr[.//a[@title="view journal details"]]')
+_TITLE_LINK_XPATH = etree.XPath('.//a[@title="view journal details"]')
+_FIRST_CELL_XPATH = etree.XPath('./td[1]')
+# Quartiles are a 'q1'..'q4' token in an element's class list, which may
+# hold other classes too
+_QUARTILE_XPATH = etree.XPath(
+    './/*[contains(concat(" ", normalize-space(@class), " "), " q1 ") or '
+    'contains(concat(" ", normalize-space(@class), " "), " q2 ") or '
+    'contains(concat(" ", normalize-space(@class), " "), " q3 ") or '
+    'contains(concat(" ", normalize-space(@class), " "), " q4 ")]/@class')
+_QUARTILE_RE = re.compile(r"\bq[1-4]\b")
+
+# Parsed ranking pages of the most recently used categories, keyed by
+# (category_id, year). Looking up another journal in a category that was
+# already scraped needs neither the network nor the HTML parser. Entries
+# expire together with the HTTP cache (see `_category_cache`).
+_RANKING_CACHE = OrderedDict()
+_RANKING_CACHE_LOCK = threading.Lock()
+
+# Journal searches that found nothing, keyed by lowercase name, so retries
+# of a missing journal don't re-hit the network for a while
+_MISSING_JOURNALS = {}
+
+class RateLimiter:
+    """
+    Throttles requests shared by all threads:
+    - at most `rpm` requests in any sliding 60 s window,
+    - at least `delay` seconds between two consecutive requests,
+    - a concurrency limit adapted with AIMD: it grows by 0.5 after each
+      successful response and is halved on 429 or 5xx responses.
+    """
+    def __init__(self, delay, rpm, max_concurrency):
+        self.delay = delay
+        self.rpm = rpm
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.active = 0
+        self._sent = deque()
+        self._last = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= 60:
+                    self._sent.popleft()
+
+                if len(self._sent) >= self.rpm:
+                    timeout = 60 - (now - self._sent[0])
+                elif self.active >= int(self.concurrency):
+                    timeout = None # Wait for a release
+                else:
+                    timeout = self._last + self.delay - now
+                    if timeout <= 0:
+                        break
+                self._cond.wait(timeout)
+
+            self.active += 1
+            self._last = now
+            self._sent.append(now)
+
+    def release(self, status_code=None):
+        with self._cond:
+            self.active -= 1
+            if status_code is None or status_code == 429 or status_code >= 500:
+                self.concurrency = max(1.0, self.concurrency * 0.5)
+            else:
+                self.concurrency = min(self.max_concurrency,
+                                       self.concurrency + 0.5)
+            self._cond.notify_all()
+
+class PoliteAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that goes through a RateLimiter. Responses served from the
+    disk cache never reach the adapter, so they are not throttled.
+    """
+    def __init__(self, limiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        status_code = None
+        try:
+            response = super().send(request, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            self.limiter.release(status_code)
+
+LIMITER = RateLimiter(RATE_LIMIT_DELAY, RATE_LIMIT_RPM, MAX_WORKERS)
+
+# Ranking pages are large HTML documents that compress well. Brotli is only
+# advertised when a decoder is installed, otherwise the body is unreadable.
+if importlib.util.find_spec("brotli"):
+    ACCEPT_ENCODING = "gzip, deflate, br"
+else:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Shared session so every request to scimagojr.com reuses pooled connections
+# instead of paying a new TCP+TLS handshake each time. Successful responses
+# are also cached on disk, so repeated lookups (e.g. other journals in the
+# same category) are served without touching the network.
+SESSION = requests_cache.CachedSession(
+    os.path.join(CACHE_DIR, "scimago_cache"),
+    expire_after=CACHE_EXPIRY,
+    allowable_methods=["GET"])
+SESSION.headers.update({
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+})
+SESSION.mount("https://", PoliteAdapter(LIMITER,
+                                        pool_connections=10, pool_maxsize=10))
+
+def polite_get(url, **kwargs):
+    """
+    GET through the shared, rate limited session, honoring 'Retry-After' on
+    429 responses.
+    """
+    for _ in range(MAX_RETRIES):
+        response = SESSION.get(url, **kwargs)
+        if response.status_code != 429:
+            break
+        retry_after = response.headers.get("Retry-After", "5")
+        delay = int(retry_after) if retry_after.isdigit() else 5
+        print(f"Rate limited, retrying in {delay}s...")
+        time.sleep(delay)
+
+    # Shown once per session by the default warnings filter
+    if response.ok and not response.headers.get("Content-Encoding"):
+        warnings.warn("SCImago response was not compressed; a proxy may be "
+                      "stripping the Accept-Encoding header.")
+    return response
 
 def get_journal_categories(journal_name):
     """
@@ -17,19 +203,27 @@ def get_journal_categories(journal_name):
     # 1. Search for the journal to get the profile URL
     search_url = "https://www.scimagojr.com/journalsearch.php"
     params = {"q": journal_name}
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+
+    needle = journal_name.lower()
+    missing_since = _MISSING_JOURNALS.get(needle)
+    if missing_since and time.monotonic() - missing_since < MISSING_TTL:
+        print("Journal not found (cached).")
+        return None
 
     print(f"Searching for '{journal_name}'...")
     
     try:
-        resp = requests.get(search_url, params=params, headers=headers)
-        soup = BeautifulSoup(resp.content, "html.parser")
+        resp = polite_get(search_url, params=params)
+        # Server errors are not remembered as missing journals
+        if resp.status_code != 200:
+            print(f"Error searching journal: Status {resp.status_code}")
+            return None
+        tree = html.fromstring(resp.content, parser=_HTML_PARSER)
         
         # The search result list
-        search_results = soup.find_all("div", class_="search_results")
-        search_results = search_results[0].find_all("a")
+        results_div = tree.find_class("search_results")
+        results_div = results_div[0] if results_div else None
+        search_results = _JOURNAL_LINKS_XPATH(results_div) if results_div is not None else []
         
         journal_link = None
         real_title = None
@@ -37,13 +231,14 @@ def get_journal_categories(journal_name):
         # Loop to find the journal
         if search_results:
             for result in search_results:
-                journal_link = result['href']
-                real_title = result.find("span", class_="jrnlname").get_text(strip=True)
-                if real_title.lower() == journal_name.lower():
+                journal_link = result.get("href")
+                real_title = result.find_class("jrnlname")[0].text_content().strip()
+                if real_title.lower() == needle:
                     break
         
         if not journal_link:
             print("Journal not found.")
+            _MISSING_JOURNALS[needle] = time.monotonic()
             return None
 
         # Fix relative URL if necessary
@@ -53,26 +248,39 @@ def get_journal_categories(journal_name):
         print(f"Found profile: {real_title}")
         # print(f"URL: {journal_link}")
 
-        # 2. Go to the specific journal profile page
-        profile_resp = requests.get(journal_link, headers=headers)
-        profile_soup = BeautifulSoup(profile_resp.content, "html.parser")
-        
-        # 3. Extract Categories
+        # 2. Extract Categories
         # Structure: <a>Category Name</a>
+        # They are sometimes listed with the search results already; only
+        # trust those when the journal is the single result
         categories_data = []
-        cat_links = profile_soup.find_all("a",
-                                          href=lambda href: href and "journalrank.php?category=" in href)
+        cat_links = []
+        if len(search_results) == 1:
+            cat_links = _CAT_LINKS_XPATH(results_div)
+
+        if not cat_links:
+            # 3. Go to the specific journal profile page
+            profile_resp = polite_get(journal_link)
+            if profile_resp.status_code != 200:
+                print(f"Error fetching profile: Status {profile_resp.status_code}")
+                return None
+            profile_tree = html.fromstring(profile_resp.content, parser=_HTML_PARSER)
+            cat_links = _CAT_LINKS_XPATH(profile_tree)
         
-        category_map = {}
+        # The same link usually appears more than once (grid, list, legend),
+        # so keep only the first link for each href
+        unique_links = {}
         for link in cat_links:
-            cat_name = link.get_text(strip=True)
+            unique_links.setdefault(link.get("href"), link)
+
+        category_map = {}
+        for href, link in unique_links.items():
             # Extract category ID from href (e.g., ...?category=1702)
-            match = re.search(r"category=(\d+)", link['href'])
+            match = _CAT_RE.search(href)
             cat_id = match.group(1) if match else "Unknown"
             
-            # Avoid duplicates (sometimes appear twice)
+            # Different hrefs can still point to the same category
             if cat_id not in category_map:
-                category_map[cat_id] = cat_name
+                category_map[cat_id] = link.text_content().strip()
 
         # 4. Extract Quartiles (The colorful grid)
         print("\n--- Categories and Recent Quartiles ---")
@@ -89,57 +297,212 @@ def get_journal_categories(journal_name):
         print(f"Error: {e}")
         return None
 
-def get_total_journals(soup):
+def _exact_total_journals(tree):
+    """
+    Returns the 'total_size' parameter of the pagination links, or None.
+    """
+    # This is often hidden in the 'Next' or 'Last' buttons, and it is the
+    # same on every link that carries it, so the first match is enough
+    matches = (_TOTAL_SIZE_RE.search(href) for href in _TOTAL_SIZE_HREFS_XPATH(tree))
+    match = next((match for match in matches if match), None)
+    return int(match.group(1)) if match else None
+
+def get_total_journals(tree):
     """
     Robustly finds the total number of journals.
     Method 1: Check 'total_size' parameter in pagination links.
     Method 2: Check max page number in pagination * 50.
     """
-    
     # 1. Look for 'total_size=' in any link on the page
-    # This is often hidden in the 'Next' or 'Last' buttons
-    all_links = soup.find_all("a", href=True)
-    max_total_size = 0
-    
-    for link in all_links:
-        href = link['href']
-        match = re.search(r"total_size=(\d+)", href)
-        if match:
-            val = int(match.group(1))
-            if val > max_total_size:
-                max_total_size = val
-    
-    if max_total_size > 0:
-        return max_total_size
+    total_size = _exact_total_journals(tree)
+    if total_size:
+        return total_size
 
     # 2. Fallback: Find max page number in pagination
     # Usually in a div, but we can just look for links with 'page='
-    max_page = 0
-    for link in all_links:
-        href = link['href']
-        match = re.search(r"page=(\d+)", href)
-        if match:
-            page_num = int(match.group(1))
-            if page_num > max_page:
-                max_page = page_num
+    matches = (_PAGE_RE.search(href) for href in _PAGE_HREFS_XPATH(tree))
+    max_page = max((int(match.group(1)) for match in matches if match), default=0)
     
     if max_page > 0:
         # Estimate based on last page
-        return max_page * 50
+        return max_page * PAGE_SIZE
 
     return None
 
-def get_category_name(soup, category_id):
+def get_category_name(tree, category_id):
     """
     Get category name from page title
     """
-    page_title = soup.title.get_text(strip=True) if soup.title else ""
+    page_title = (tree.findtext(".//title") or "").strip()
     cat_name = page_title.replace('Journal Rankings on', '')
     return cat_name
 
+def _parse_ranking_table(tree):
+    """
+    Parses the journals listed on one ranking page.
+
+    Returns:
+        DataFrame: 'Rank', 'Title' and 'Quartile' columns, one row per
+        journal, in page order.
+    """
+    ranks, titles, quartiles = [], [], []
+    # SCImago tables are usually standard HTML tables; only rows holding a
+    # journal link are kept, which skips headers, footers and notes
+    for row in _JOURNAL_ROWS_XPATH(tree):
+        # Rank is usually the first column
+        cells = _FIRST_CELL_XPATH(row)
+        ranks.append(cells[0].text_content().strip() if cells else "")
+        titles.append(_TITLE_LINK_XPATH(row)[0].text_content().strip())
+
+        # Quartiles are only encoded as a 'q1', 'q2', etc. class
+        q_classes = _QUARTILE_XPATH(row)
+        if q_classes:
+            quartiles.append(_QUARTILE_RE.search(q_classes[0]).group().upper())
+        else:
+            quartiles.append("N/A")
+
+    return pd.DataFrame({"Rank": ranks, "Title": titles, "Quartile": quartiles},
+                        dtype=str)
+
+def _find_journal(table, journal_name):
+    """
+    Returns (title, rank, quartile) of the first journal in `table` whose
+    title contains `journal_name` (case-insensitive), or None.
+    """
+    matches = table[table["Title"].str.contains(journal_name, case=False,
+                                                regex=False)]
+    if matches.empty:
+        return None
+    first = matches.iloc[0]
+    return first["Title"], first["Rank"], first["Quartile"]
+
+def _fetch_ranking_page(category_id, page, year):
+    """
+    Downloads one page of a category ranking.
+
+    Returns:
+        bytes: The page HTML, or None if the page could not be fetched.
+    """
+    # Construct the URL for the specific category and page
+    year_param = f"&year={year}" if year else ""
+    url = f"{BASE_URL}?category={category_id}&page={page}{year_param}"
+    print(url)
+
+    response = polite_get(url)
+    if response.status_code != 200:
+        print(f"Error fetching page {page}: Status {response.status_code}")
+        return None
+
+    return response.content
+
+def _category_cache(category_id, year):
+    """
+    Returns the in-memory cache entry of a category ranking: a dict with
+    the parsed 'pages' ({page: table}) and, once page 1 is parsed, 'info'
+    (number of journals, whether that number is exact, category name).
+
+    Entries are dropped after CACHE_EXPIRY, so "latest year" rankings are
+    refreshed, and only the MAX_CACHED_CATEGORIES most recently used ones
+    are kept.
+    """
+    key = (str(category_id), year or "")
+    now = time.monotonic()
+    with _RANKING_CACHE_LOCK:
+        entry = _RANKING_CACHE.get(key)
+        if entry is None or now - entry["created"] > CACHE_EXPIRY.total_seconds():
+            entry = {"created": now, "info": None, "pages": {}}
+            _RANKING_CACHE[key] = entry
+        _RANKING_CACHE.move_to_end(key)
+        while len(_RANKING_CACHE) > MAX_CACHED_CATEGORIES:
+            _RANKING_CACHE.popitem(last=False)
+    return entry
+
+def _ranking_table(cached, category_id, page, year):
+    """
+    Returns the parsed table of one ranking page (see
+    `_parse_ranking_table`), downloading it only if it is not in `cached`
+    (see `_category_cache`) yet. Page 1 also records the category info.
+
+    Returns None under the same conditions as `_fetch_ranking_page`.
+    """
+    table = cached["pages"].get(page)
+    if table is not None:
+        return table
+
+    content = _fetch_ranking_page(category_id, page, year)
+    if content is None:
+        return None
+
+    tree = html.fromstring(content, parser=_HTML_PARSER)
+    if page == 1:
+        # Only 'total_size' is exact; the fallback estimate is based on the
+        # page links visible on page 1
+        exact_total = _exact_total_journals(tree)
+        cached["info"] = (exact_total or get_total_journals(tree),
+                          exact_total is not None,
+                          get_category_name(tree, category_id))
+    table = _parse_ranking_table(tree)
+    cached["pages"][page] = table
+    return table
+
+class _PageSearch:
+    """
+    State shared by the pagination workers of one `get_scimago_ranking`
+    call. `stop_after` is the lowest page known to end the search; pages
+    above it are skipped, pages below it are always searched so the best
+    ranked match wins. `failed_at` is the lowest page that could not be
+    fetched: a match beyond it might not be the best ranked one.
+    """
+    def __init__(self, last_page):
+        self.stop_after = last_page
+        self.failed_at = None
+        self._lock = threading.Lock()
+
+    def stop_at(self, page):
+        with self._lock:
+            self.stop_after = min(self.stop_after, page)
+
+    def fail_at(self, page):
+        with self._lock:
+            self.stop_after = min(self.stop_after, page)
+            if self.failed_at is None or page < self.failed_at:
+                self.failed_at = page
+
+    def needs(self, page):
+        return page <= self.stop_after
+
+def _search_page(journal_name, cached, category_id, page, year, search):
+    """
+    Worker for the concurrent pagination in `get_scimago_ranking`.
+    """
+    if not search.needs(page):
+        return None
+
+    table = _ranking_table(cached, category_id, page, year)
+    if table is None:
+        search.fail_at(page)
+        return None
+
+    # Pages past the end of the ranking have no journal rows, and neither
+    # will any page after them
+    if table.empty:
+        search.stop_at(page)
+        return None
+
+    match = _find_journal(table, journal_name)
+    if match:
+        search.stop_at(page)
+        return match
+
+    print(f"Checked page {page}...")
+    return None
+
 def get_scimago_ranking(journal_name, category_id, year):
     """
     Finds the rank and quartile of a journal within a specific SCImago category.
+
+    The first page is fetched on its own to learn the category size; the
+    remaining pages are then fetched concurrently.
     
     Args:
         journal_name (str): The name of the journal to find (case-insensitive).
@@ -149,96 +512,148 @@ def get_scimago_ranking(journal_name, category_id, year):
         dict: A dictionary containing 'Rank', 'Quartile', and 'Category', or
         None if not found.
     """
-    base_url = "https://www.scimagojr.com/journalrank.php"
-    page = 1
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-
     print(f"Searching for '{journal_name}' in Category ID: {category_id}...")
 
-    while True:
-        # Construct the URL for the specific category and page
-        year_param = f"&year={year}" if year else ""
-        url = f"{base_url}?category={category_id}&page={page}{year_param}"
-        print(url)
-        
-        try:
-            response = requests.get(url, headers=headers)
-            if response.status_code != 200:
-                print(f"Error fetching page {page}: Status {response.status_code}")
-                break
-                
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Get total number of journals
-            number_journals = get_total_journals(soup)
-            
-            # SCImago tables are usually standard HTML tables
-            table_rows = soup.find_all("tr")
+    try:
+        cached = _category_cache(category_id, year)
+        table = _ranking_table(cached, category_id, 1, year)
+        if table is None:
+            return None
 
-            # Get category name
-            category_name = get_category_name(soup, category_id)
-            
-            # If no rows (except header), we've reached the end
-            if len(table_rows) <= 1: 
-                break
-                
-            # Iterate through rows (skipping header if necessary)
-            for row in table_rows:
-                # The title is usually in an anchor tag within the row
-                title_tag = row.find("a", title="view journal details")
-                if title_tag:
-                    curr_journal_title = title_tag.get_text(strip=True)
-                    
-                    # Check for partial or exact match
-                    if journal_name.lower() in curr_journal_title.lower():
-                        # Extract Rank: usually the first column text
-                        cols = row.find_all("td")
-                        rank = cols[0].get_text(strip=True)
-                        
-                        # Extract Quartile: Look for a span/div with class
-                        # 'q1', 'q2', etc.
-                        quartile = "N/A"
-                        for q_class in ['q1', 'q2', 'q3', 'q4']:
-                            if row.find(class_=q_class):
-                                quartile = q_class.upper()
-                                break
-                        
-                        if year == '':
-                            year = datetime.now().year
-                        # One of the entries is a list so the dataframe is
-                        # displayed more nicely
-                        return {
-                            "Journal": curr_journal_title,
-                            "Category name": [category_name],
-                            "Category Rank": f'#{rank} of {number_journals}',
-                            "Percentile": f'{100*int(rank)/number_journals:.2f}%',
-                            "Quartile": quartile,
-                            "Year": year,
-                        }
-            
-            # Check if there is a 'Next' button to continue; otherwise, safety break
-            pagination = soup.find("div", class_="pagination")
-            if not pagination or "Next" not in pagination.get_text():
-                 # Sometimes pagination is just page numbers; scraping blindly
-                 # until empty is safer
-                 pass
-            
-            print(f"Checked page {page}...")
-            page += 1
-            time.sleep(1) # Be polite to the server
-            
-            if page > 100: # Safety break to prevent infinite loops
-                print("Reached page limit (100). Journal not found.")
-                break
-                
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            break
+        # Get total number of journals and the category name; both are the
+        # same on every page
+        number_journals, exact_total, category_name = cached["info"]
+        if exact_total:
+            last_page = math.ceil(number_journals / PAGE_SIZE)
+        else:
+            # Safety bound; the search also stops at the first empty page
+            last_page = MAX_PAGES
+
+        match = _find_journal(table, journal_name)
+        if not match and last_page > 1 and not table.empty:
+            print("Checked page 1...")
+            search = _PageSearch(last_page)
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [executor.submit(_search_page, journal_name, cached,
+                                           category_id, page, year, search)
+                           for page in range(2, last_page + 1)]
+                # Results are consumed in page order, and pages below a
+                # match are never skipped, so the best ranked match wins
+                # even if a later page finishes first
+                for page, future in enumerate(futures, start=2):
+                    match = future.result()
+                    if match or not search.needs(page + 1):
+                        break
+                for future in futures:
+                    future.cancel()
+
+            # Like a sequential scan, give up at the first page that could
+            # not be fetched rather than report a worse ranked match
+            if search.failed_at is not None and (not match
+                                                 or search.failed_at < page):
+                print(f"Could not check page {search.failed_at}; giving up.")
+                return None
+
+        if not match:
+            return None
+
+        curr_journal_title, rank, quartile = match
+
+        # The category size comes from page 1 only; unless it is exact the
+        # rank can still be reported, but not as a percentile
+        if exact_total:
+            category_rank = f'#{rank} of {number_journals}'
+            percentile = f'{100*int(rank)/number_journals:.2f}%'
+        else:
+            category_rank = f'#{rank}'
+            percentile = "N/A"
+
+        # Both '' (app) and None (CLI) mean the latest year
+        if not year:
+            year = datetime.now().year
+        # One of the entries is a list so the dataframe is
+        # displayed more nicely
+        return {
+            "Journal": curr_journal_title,
+            "Category name": [category_name],
+            "Category Rank": category_rank,
+            "Percentile": percentile,
+            "Quartile": quartile,
+            "Year": year,
+        }
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
 
     return None
 
+def load_journal_categories(journal_name):
+    """
+    Same as `get_journal_categories`, but results are also stored in
+    CATEGORY_CACHE for CATEGORY_CACHE_TTL seconds, so later runs skip the
+    search and profile requests.
+    """
+    try:
+        with open(CATEGORY_CACHE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    key = journal_name.lower()
+    entry = cache.get(key)
+    if isinstance(entry, dict) and time.time() - entry.get("time", 0) < CATEGORY_CACHE_TTL:
+        real_title, data = entry["result"]
+        return real_title, data
+
+    result = get_journal_categories(journal_name)
+    if result is not None:
+        cache[key] = {"time": time.time(), "result": result}
+        # Write to a temporary file and swap it in, so concurrent runs (or
+        # app sessions) never read a half-written cache
+        cache_dir = os.path.dirname(CATEGORY_CACHE)
+        tmp_name = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp",
+                                             delete=False) as f:
+                tmp_name = f.name
+                json.dump(cache, f)
+            os.replace(tmp_name, CATEGORY_CACHE)
+        except OSError as e:
+            # The cache is optional; a read-only or full disk must not
+            # lose a lookup that succeeded
+            print(f"Could not write category cache: {e}")
+            if tmp_name:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_name)
+    return result
+
+def get_all_rankings(journal_name, year):
+    """
+    Finds the rank and quartile of a journal in every category it belongs to.
+
+    Categories are scraped concurrently; the shared rate limiter keeps the
+    overall load on SCImago in check.
+
+    Args:
+        journal_name (str): The name of the journal to search for.
+        year (str): Year of the rankings, empty or None for the latest.
+
+    Returns:
+        list: One `get_scimago_ranking` result per category where the journal
+        was found, or None if the journal itself was not found.
+    """
+    categories = load_journal_categories(journal_name)
+    if categories is None:
+        return None
+    real_title, data = categories
+
+    with ThreadPoolExecutor(max_workers=CATEGORY_WORKERS) as executor:
+        results = executor.map(
+            lambda category_id: get_scimago_ranking(real_title, category_id, year),
+            data["ids"])
+        return [result for result in results if result]
+
 if __name__ == "__main__":
     # Initialize Argument Parser
     parser = argparse.ArgumentParser(description="Get SCImago rankings for a specific journal.")
@@ -249,26 +664,53 @@ if __name__ == "__main__":
                         help="The name of the journal (use quotes if it has spaces)")
     parser.add_argument("--year", "-y", type=str, help="Year (e.g., 2018)", default=None)
     parser.add_argument("--category", "-c", type=int, help="Journal Category (e.g., 2210)", default=None)
+    parser.add_argument("--all", "-a", action="store_true",
+                        help="Get the rankings in every category of the journal")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the results as JSON")
     
     # Parse arguments
     args = parser.parse_args()
-    
-    # get journal category
-    if args.category is None:
-        get_journal_categories(args.journal_name)
-        category_id = int(input("\nChoose journal category: "))
-        print()
+
+    # With --json only the results go to stdout; progress messages are sent
+    # to stderr so the output can be piped
+    if args.json:
+        progress = contextlib.redirect_stdout(sys.stderr)
     else:
-        category_id = args.category
+        progress = contextlib.nullcontext()
 
-    # Run the main function
-    result = get_scimago_ranking(args.journal_name, category_id, args.year)
+    if args.all:
+        with progress:
+            results = get_all_rankings(args.journal_name, args.year)
 
-    if result:
-        print("\n--- Result Found ---")
-        print(f"Journal: {result['Journal']}")
-        print(f"Category Rank: {result['Category Rank']}")
-        print(f"Percentile: {result['Percentile']}")
-        print(f"Quartile: {result['Quartile']}")
+        if args.json:
+            print(json.dumps(results or []))
+        elif results:
+            print("\n--- Results Found ---")
+            table = pd.DataFrame(results).explode("Category name")
+            print(table.to_string(index=False))
+        else:
+            print("\nJournal not found.")
     else:
-        print("\nJournal not found in this category.")
+        with progress:
+            # get journal category
+            if args.category is None:
+                get_journal_categories(args.journal_name)
+                category_id = int(input("\nChoose journal category: "))
+                print()
+            else:
+                category_id = args.category
+
+            # Run the main function
+            result = get_scimago_ranking(args.journal_name, category_id, args.year)
+
+        if args.json:
+            print(json.dumps(result))
+        elif result:
+            print("\n--- Result Found ---")
+            print(f"Journal: {result['Journal']}")
+            print(f"Category Rank: {result['Category Rank']}")
+            print(f"Percentile: {result['Percentile']}")
+            print(f"Quartile: {result['Quartile']}")
+        else:
+            print("\nJournal not found in this category.")
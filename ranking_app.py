@@ -1,6 +1,40 @@
+import pandas as pd
 import streamlit as st
 
-from journal_ranking import get_journal_categories, get_scimago_ranking
+from journal_ranking import (get_all_rankings, get_journal_categories,
+                             get_scimago_ranking)
+
+@st.cache_data(ttl=3600)
+def cached_ranking(journal_name, category_id, year):
+    """
+    Skips the scraper when the same query is repeated within the hour.
+    Misses raise so that they are not cached; a failed request would
+    otherwise pin "not found" for the whole hour.
+    """
+    result = get_scimago_ranking(journal_name, category_id, year)
+    if result is None:
+        raise LookupError(journal_name)
+    return result
+
+@st.cache_data(ttl=3600)
+def cached_all_rankings(journal_name, year):
+    """Same as `cached_ranking`, for every category of the journal."""
+    results = get_all_rankings(journal_name, year)
+    if not results:
+        raise LookupError(journal_name)
+    return results
+
+@st.cache_data(ttl=86400)
+def cached_categories(journal_name):
+    """
+    Categories rarely change, so they are kept for a day. Misses raise so
+    that they are not cached here; journal_ranking remembers them for a
+    shorter time instead.
+    """
+    result = get_journal_categories(journal_name)
+    if result is None:
+        raise LookupError(journal_name)
+    return result
 
 # --- UI Layout ---
 st.set_page_config(page_title="SJR Scraper", page_icon="📚")
@@ -16,36 +50,66 @@ with col2:
 with col3:
     j_year = st.text_input("Year", help="Leave empty for latest")
 
+# Category lookups already done in this session, keyed by journal name
+if "categories" not in st.session_state:
+    st.session_state["categories"] = {}
+
 # Buttons and display
-col1, col2 = st.columns(2)
-data = False
-cats = False
-rank = False
+col1, col2, col3 = st.columns(3)
+categories = None
+ranking = None
+all_rankings = None
 with col1:
     if st.button("Get Categories", type="primary"):
-        cats = True
         if j_name:
-            journal, data = get_journal_categories(j_name)
+            if j_name not in st.session_state["categories"]:
+                try:
+                    st.session_state["categories"][j_name] = cached_categories(j_name)
+                except LookupError:
+                    st.warning(f'No journal found for "{j_name}".')
+            categories = st.session_state["categories"].get(j_name)
         else:
             st.warning("Please enter a journal name.")
 
 with col2:
     if st.button("Get Rankings", type="primary"):
-        rank = True
+        if not j_name:
+            st.warning("Please enter a journal name.")
+        elif not j_cate:
+            st.warning("Please enter a category id.")
+        else:
+            try:
+                ranking = cached_ranking(j_name, j_cate, j_year)
+            except LookupError:
+                st.warning(f'"{j_name}" was not found in category {j_cate}.')
+
+with col3:
+    if st.button("Get All Rankings", type="primary"):
         if j_name:
-            data = get_scimago_ranking(j_name, j_cate, j_year)
+            try:
+                all_rankings = cached_all_rankings(j_name, j_year)
+            except LookupError:
+                st.warning(f'No rankings found for "{j_name}".')
         else:
             st.warning("Please enter a journal name.")
 
-if data and cats:
+if categories:
+    journal, data = categories
     st.write(f'Showing categories for "{journal}"')
     st.dataframe(data,
                  hide_index=True,
                  use_container_width=True)
 
-if data and rank:
+if ranking:
+    st.dataframe(
+        ranking,
+        use_container_width=True,
+        hide_index=True,
+    )
+
+if all_rankings:
     st.dataframe(
-        data,
+        pd.DataFrame(all_rankings).explode("Category name"),
         use_container_width=True,
         hide_index=True,
     )